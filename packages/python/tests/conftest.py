@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
+import textwrap
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -11,109 +14,13 @@ if TYPE_CHECKING:
 from html_to_markdown import ConversionOptions, PreprocessingOptions
 from html_to_markdown import convert as convert_api
 
-TEST_DOCUMENTS_DIR = Path(__file__).resolve().parents[3] / "test_documents"
 
+@functools.cache
+def get_test_documents_dir() -> Path:
+    return Path(__file__).resolve().parents[3] / "test_documents"
 
-@pytest.fixture
-def parser() -> str:
-    return "html.parser"
-
-
-@pytest.fixture
-def convert_v2() -> Callable[..., str]:
-    def _convert(
-        html: str,
-        *,
-        heading_style: Literal["underlined", "atx", "atx_closed"] = "atx",
-        list_indent_type: Literal["spaces", "tabs"] = "spaces",
-        list_indent_width: int = 2,
-        bullets: str = "-*+",
-        strong_em_symbol: Literal["*", "_"] = "*",
-        escape_asterisks: bool = False,
-        escape_underscores: bool = False,
-        escape_misc: bool = False,
-        escape_ascii: bool = False,
-        code_language: str = "",
-        code_block_style: Literal["indented", "backticks", "tildes"] = "backticks",
-        autolinks: bool = True,
-        default_title: bool = False,
-        br_in_tables: bool = False,
-        highlight_style: Literal["double-equal", "html", "bold"] = "double-equal",
-        extract_metadata: bool = True,
-        whitespace_mode: Literal["normalized", "strict"] = "normalized",
-        strip_newlines: bool = False,
-        wrap: bool = False,
-        wrap_width: int = 80,
-        convert_as_inline: bool = False,
-        sub_symbol: str = "",
-        sup_symbol: str = "",
-        newline_style: Literal["spaces", "backslash"] = "spaces",
-        keep_inline_images_in: set[str] | None = None,
-        preprocess: bool = False,
-        preprocessing_preset: Literal["minimal", "standard", "aggressive"] = "standard",
-        remove_navigation: bool = True,
-        remove_forms: bool = True,
-        source_encoding: str = "utf-8",
-        strip: list[str] | None = None,
-        strip_tags: list[str] | None = None,
-        preserve_tags: list[str] | None = None,
-        skip_images: bool = False,
-    ) -> str:
-        final_strip_tags = strip_tags or strip
-
-        options = ConversionOptions(
-            heading_style=heading_style,
-            list_indent_type=list_indent_type,
-            list_indent_width=list_indent_width,
-            bullets=bullets,
-            strong_em_symbol=strong_em_symbol,
-            escape_asterisks=escape_asterisks,
-            escape_underscores=escape_underscores,
-            escape_misc=escape_misc,
-            escape_ascii=escape_ascii,
-            code_language=code_language,
-            code_block_style=code_block_style,
-            autolinks=autolinks,
-            default_title=default_title,
-            br_in_tables=br_in_tables,
-            highlight_style=highlight_style,
-            extract_metadata=extract_metadata,
-            whitespace_mode=whitespace_mode,
-            strip_newlines=strip_newlines,
-            wrap=wrap,
-            wrap_width=wrap_width,
-            convert_as_inline=convert_as_inline,
-            sub_symbol=sub_symbol,
-            sup_symbol=sup_symbol,
-            newline_style=newline_style,
-            keep_inline_images_in=keep_inline_images_in,
-            strip_tags=set(final_strip_tags) if final_strip_tags else None,
-            preserve_tags=set(preserve_tags) if preserve_tags else None,
-            skip_images=skip_images,
-        )
-
-        preprocessing = PreprocessingOptions(
-            enabled=preprocess,
-            preset=preprocessing_preset,
-            remove_navigation=remove_navigation,
-            remove_forms=remove_forms,
-        )
-
-        options.encoding = source_encoding
-
-        return convert_api(html, options, preprocessing)
-
-    return _convert
 
-
-@pytest.fixture
-def convert(convert_v2: Callable[..., str]) -> Callable[..., str]:
-    return convert_v2
-
-
-@pytest.fixture
-def nested_uls() -> str:
-    return """
+_NESTED_ULS = textwrap.dedent("""
     <ul>
         <li>1
             <ul>
@@ -130,12 +37,9 @@ def nested_uls() -> str:
         </li>
         <li>2</li>
         <li>3</li>
-    </ul>"""
+    </ul>""").strip()
 
-
-@pytest.fixture
-def nested_ols() -> str:
-    return """
+_NESTED_OLS = textwrap.dedent("""
     <ol>
         <li>1
             <ol>
@@ -152,12 +56,10 @@ def nested_ols() -> str:
         </li>
         <li>2</li>
         <li>3</li>
-    </ul>"""
-
+    </ul>""").strip()
 
-@pytest.fixture
-def table() -> str:
-    return """<table>
+_RAW_TABLE_FIXTURES = {
+    "default": """<table>
     <tr>
         <th>Firstname</th>
         <th>Lastname</th>
@@ -173,12 +75,8 @@ def table() -> str:
         <td>Jackson</td>
         <td>94</td>
     </tr>
-</table>"""
-
-
-@pytest.fixture
-def table_with_html_content() -> str:
-    return """<table>
+</table>""",
+    "with_html_content": """<table>
     <tr>
         <th>Firstname</th>
         <th>Lastname</th>
@@ -194,12 +92,8 @@ def table_with_html_content() -> str:
         <td>Jackson</td>
         <td>94</td>
     </tr>
-</table>"""
-
-
-@pytest.fixture
-def table_with_paragraphs() -> str:
-    return """<table>
+</table>""",
+    "with_paragraphs": """<table>
     <tr>
         <th>Firstname</th>
         <th><p>Lastname</p></th>
@@ -215,12 +109,8 @@ def table_with_paragraphs() -> str:
         <td>Jackson</td>
         <td>94</td>
     </tr>
-</table>"""
-
-
-@pytest.fixture
-def table_with_linebreaks() -> str:
-    return """<table>
+</table>""",
+    "with_linebreaks": """<table>
     <tr>
         <th>Firstname</th>
         <th>Lastname</th>
@@ -238,12 +128,8 @@ def table_with_linebreaks() -> str:
         Smith</td>
         <td>94</td>
     </tr>
-</table>"""
-
-
-@pytest.fixture
-def table_with_header_column() -> str:
-    return """<table>
+</table>""",
+    "with_header_column": """<table>
     <tr>
         <th>Firstname</th>
         <th>Lastname</th>
@@ -259,12 +145,8 @@ def table_with_header_column() -> str:
         <td>Jackson</td>
         <td>94</td>
     </tr>
-</table>"""
-
-
-@pytest.fixture
-def table_head_body() -> str:
-    return """<table>
+</table>""",
+    "head_body": """<table>
     <thead>
         <tr>
             <th>Firstname</th>
@@ -284,12 +166,8 @@ def table_head_body() -> str:
             <td>94</td>
         </tr>
     </tbody>
-</table>"""
-
-
-@pytest.fixture
-def table_head_body_missing_head() -> str:
-    return """<table>
+</table>""",
+    "head_body_missing_head": """<table>
     <thead>
         <tr>
             <td>Firstname</td>
@@ -309,12 +187,8 @@ def table_head_body_missing_head() -> str:
             <td>94</td>
         </tr>
     </tbody>
-</table>"""
-
-
-@pytest.fixture
-def table_missing_text() -> str:
-    return """<table>
+</table>""",
+    "missing_text": """<table>
     <thead>
         <tr>
             <th></th>
@@ -334,12 +208,8 @@ def table_missing_text() -> str:
             <td>94</td>
         </tr>
     </tbody>
-</table>"""
-
-
-@pytest.fixture
-def table_missing_head() -> str:
-    return """<table>
+</table>""",
+    "missing_head": """<table>
     <tr>
         <td>Firstname</td>
         <td>Lastname</td>
@@ -355,12 +225,8 @@ def table_missing_head() -> str:
         <td>Jackson</td>
         <td>94</td>
     </tr>
-</table>"""
-
-
-@pytest.fixture
-def table_body() -> str:
-    return """<table>
+</table>""",
+    "body": """<table>
     <tbody>
         <tr>
             <td>Firstname</td>
@@ -378,23 +244,15 @@ def table_body() -> str:
             <td>94</td>
         </tr>
     </tbody>
-</table>"""
-
-
-@pytest.fixture
-def table_with_caption() -> str:
-    return """TEXT<table><caption>Caption</caption>
+</table>""",
+    "with_caption": """TEXT<table><caption>Caption</caption>
     <tbody><tr><td>Firstname</td>
             <td>Lastname</td>
             <td>Age</td>
         </tr>
     </tbody>
-</table>"""
-
-
-@pytest.fixture
-def table_with_colspan() -> str:
-    return """<table>
+</table>""",
+    "with_colspan": """<table>
     <tr>
         <th colspan="2">Name</th>
         <th>Age</th>
@@ -409,12 +267,8 @@ def table_with_colspan() -> str:
         <td>Jackson</td>
         <td>94</td>
     </tr>
-</table>"""
-
-
-@pytest.fixture
-def table_with_undefined_colspan() -> str:
-    return """<table>
+</table>""",
+    "with_undefined_colspan": """<table>
     <tr>
         <th colspan="undefined">Name</th>
         <th>Age</th>
@@ -423,4 +277,98 @@ def table_with_undefined_colspan() -> str:
         <td colspan="-1">Jill</td>
         <td>Smith</td>
     </tr>
-</table>"""
+</table>""",
+}
+_TABLE_FIXTURES: dict[str, str] = {key: textwrap.dedent(html).strip() for key, html in _RAW_TABLE_FIXTURES.items()}
+
+
+@pytest.fixture(scope="session")
+def parser() -> str:
+    return "html.parser"
+
+
+_DEFAULT_CONVERSION_OPTIONS = ConversionOptions()
+_DISABLED_PREPROCESSING = PreprocessingOptions(
+    enabled=False,
+    preset="standard",
+    remove_navigation=True,
+    remove_forms=True,
+)
+
+_PREPROCESSING_FIELDS = {
+    "preprocess": "enabled",
+    "preprocessing_preset": "preset",
+    "remove_navigation": "remove_navigation",
+    "remove_forms": "remove_forms",
+}
+_TAG_SET_FIELDS = frozenset({"strip_tags", "preserve_tags"})
+
+
+@functools.lru_cache(maxsize=512)
+def _build_options(
+    frozen_overrides: tuple[tuple[str, Any], ...],
+) -> tuple[ConversionOptions, PreprocessingOptions]:
+    conversion_overrides: dict[str, Any] = {}
+    preprocessing_overrides: dict[str, Any] = {}
+    strip = None
+
+    for key, value in frozen_overrides:
+        if key in _PREPROCESSING_FIELDS:
+            preprocessing_overrides[_PREPROCESSING_FIELDS[key]] = value
+        elif key == "source_encoding":
+            conversion_overrides["encoding"] = value
+        elif key == "strip":
+            strip = value
+        elif key in _TAG_SET_FIELDS:
+            conversion_overrides[key] = set(value) if value else None
+        elif key == "keep_inline_images_in":
+            conversion_overrides[key] = set(value) if value is not None else None
+        else:
+            conversion_overrides[key] = value
+
+    if strip and not conversion_overrides.get("strip_tags"):
+        conversion_overrides["strip_tags"] = set(strip)
+
+    options = dataclasses.replace(_DEFAULT_CONVERSION_OPTIONS, **conversion_overrides)
+    preprocessing = (
+        dataclasses.replace(_DISABLED_PREPROCESSING, **preprocessing_overrides)
+        if preprocessing_overrides
+        else _DISABLED_PREPROCESSING
+    )
+    return options, preprocessing
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, set)):
+        return frozenset(value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def convert_v2() -> Callable[..., str]:
+    def _convert(html: str, **overrides: Any) -> str:
+        frozen_overrides = tuple(sorted((key, _freeze(value)) for key, value in overrides.items()))
+        options, preprocessing = _build_options(frozen_overrides)
+        return convert_api(html, options, preprocessing)
+
+    return _convert
+
+
+@pytest.fixture(scope="session")
+def convert(convert_v2: Callable[..., str]) -> Callable[..., str]:
+    return convert_v2
+
+
+@pytest.fixture(scope="session")
+def nested_uls() -> str:
+    return _NESTED_ULS
+
+
+@pytest.fixture(scope="session")
+def nested_ols() -> str:
+    return _NESTED_OLS
+
+
+@pytest.fixture
+def table_variant(request: pytest.FixtureRequest) -> str:
+    return _TABLE_FIXTURES[request.param]
@@ -12,15 +12,15 @@ import pytest
 
 from html_to_markdown import ConversionOptions, convert
 
-from .conftest import TEST_DOCUMENTS_DIR
+from .conftest import get_test_documents_dir
 
 
 def get_hocr_file(filename: str) -> Path:
-    return TEST_DOCUMENTS_DIR / "test_data" / "hocr" / filename
+    return get_test_documents_dir() / "test_data" / "hocr" / filename
 
 
 def get_expected_markdown(filename: str) -> str:
-    return (TEST_DOCUMENTS_DIR / "test_data" / "hocr_expected" / filename).read_text(encoding="utf-8")
+    return (get_test_documents_dir() / "test_data" / "hocr_expected" / filename).read_text(encoding="utf-8")
 
 
 def convert_hocr_file(filename: str, **kwargs: Any) -> str:
@@ -242,7 +242,7 @@ def test_math_paragraph_hocr_does_not_emit_code_block() -> None:
 
 
 def test_multilingual_hocr_conversion() -> None:
-    hocr_content = (TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / "valid_file.hocr").read_text(
+    hocr_content = (get_test_documents_dir() / "test_data" / "hocr" / "comprehensive" / "valid_file.hocr").read_text(
         encoding="utf-8"
     )
 
@@ -266,7 +266,7 @@ def test_multilingual_hocr_conversion() -> None:
 
 
 def test_utf8_encoding_hocr() -> None:
-    hocr_content = (TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / "utf8_encoding.hocr").read_text(
+    hocr_content = (get_test_documents_dir() / "test_data" / "hocr" / "comprehensive" / "utf8_encoding.hocr").read_text(
         encoding="utf-8"
     )
 
@@ -276,9 +276,9 @@ def test_utf8_encoding_hocr() -> None:
 
 
 def test_overlapping_bbox_hocr() -> None:
-    hocr_content = (TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / "bbox_overlapping.hocr").read_text(
-        encoding="utf-8"
-    )
+    hocr_content = (
+        get_test_documents_dir() / "test_data" / "hocr" / "comprehensive" / "bbox_overlapping.hocr"
+    ).read_text(encoding="utf-8")
 
     result = convert(hocr_content)
     content = get_content_without_frontmatter(result)
@@ -299,7 +299,7 @@ def test_overlapping_bbox_hocr() -> None:
     ],
 )
 def test_comprehensive_hocr_files(comprehensive_file: str) -> None:
-    hocr_path = TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / comprehensive_file
+    hocr_path = get_test_documents_dir() / "test_data" / "hocr" / "comprehensive" / comprehensive_file
     hocr_content = hocr_path.read_text(encoding="utf-8")
 
     result = convert(hocr_content)
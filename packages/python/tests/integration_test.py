@@ -192,68 +192,38 @@ def test_li_text(convert: Callable[..., str]) -> None:
     )
 
 
-def test_table(
-    table: str,
-    table_with_html_content: str,
-    table_with_paragraphs: str,
-    table_with_linebreaks: str,
-    table_with_header_column: str,
-    table_head_body: str,
-    table_head_body_missing_head: str,
-    table_missing_text: str,
-    table_missing_head: str,
-    table_body: str,
-    table_with_caption: str,
-    table_with_colspan: str,
-    table_with_undefined_colspan: str,
-    convert: Callable[..., str],
-) -> None:
-    assert (
-        convert(table)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_with_html_content)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| **Jill** | *Smith* | [50](#) |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_with_paragraphs)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_with_linebreaks)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith  Jackson | 50 |\n| Eve | Jackson  Smith | 94 |\n"
-    )
-    assert (
-        convert(table_with_header_column)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_head_body)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_head_body_missing_head)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_missing_text)
-        == "\n\n|  | Lastname | Age |\n| --- | --- | --- |\n| Jill |  | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_missing_head)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_body)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert convert(table_with_caption) == "TEXT\n\n*Caption*\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n"
-    assert (
-        convert(table_with_colspan)
-        == "\n\n| Name | | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert convert(table_with_undefined_colspan) == "\n\n| Name | Age |\n| --- | --- |\n| Jill | Smith |\n"
+_BASIC_TABLE_MARKDOWN = (
+    "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
+)
+
+
+@pytest.mark.parametrize(
+    ("table_variant", "expected"),
+    [
+        ("default", _BASIC_TABLE_MARKDOWN),
+        (
+            "with_html_content",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| **Jill** | *Smith* | [50](#) |\n| Eve | Jackson | 94 |\n",
+        ),
+        ("with_paragraphs", _BASIC_TABLE_MARKDOWN),
+        (
+            "with_linebreaks",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith  Jackson | 50 |\n| Eve | Jackson  Smith | 94 |\n",
+        ),
+        ("with_header_column", _BASIC_TABLE_MARKDOWN),
+        ("head_body", _BASIC_TABLE_MARKDOWN),
+        ("head_body_missing_head", _BASIC_TABLE_MARKDOWN),
+        ("missing_text", "\n\n|  | Lastname | Age |\n| --- | --- | --- |\n| Jill |  | 50 |\n| Eve | Jackson | 94 |\n"),
+        ("missing_head", _BASIC_TABLE_MARKDOWN),
+        ("body", _BASIC_TABLE_MARKDOWN),
+        ("with_caption", "TEXT\n\n*Caption*\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n"),
+        ("with_colspan", "\n\n| Name | | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"),
+        ("with_undefined_colspan", "\n\n| Name | Age |\n| --- | --- |\n| Jill | Smith |\n"),
+    ],
+    indirect=["table_variant"],
+)
+def test_table(table_variant: str, expected: str, convert: Callable[..., str]) -> None:
+    assert convert(table_variant) == expected
 
 
 def inline_tests(tag: str, markup: str, convert: Callable[..., str]) -> None:
@@ -15,153 +15,72 @@ Tests cover:
 
 from __future__ import annotations
 
+import functools
+import re
 from typing import TYPE_CHECKING
 
+import pytest
+
 from html_to_markdown import (
     ConversionOptions,
+    OptionsHandle,
+    PreprocessingOptions,
     convert_with_handle,
     convert_with_metadata,
     create_options_handle,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
 
-def test_skip_images_true_removes_image_markdown(convert: Callable[..., str]) -> None:
-    """Verify that images are skipped when skip_images=True."""
-    html = '<img src="https://example.com/image.jpg" alt="Test Image">'
-    result = convert(html, skip_images=True)
-    assert "![Test Image]" not in result
-    assert "https://example.com/image.jpg" not in result
+_IMAGE_CI = re.compile("image", re.IGNORECASE)
+_ITEM_PAT = re.compile(r"- Item ([123])")
 
 
-def test_skip_images_false_includes_image_markdown(convert: Callable[..., str]) -> None:
-    """Verify that images are included by default (skip_images=False)."""
-    html = '<img src="https://example.com/image.jpg" alt="Test Image">'
-    result = convert(html, skip_images=False)
-    assert "![Test Image](https://example.com/image.jpg)" in result
+@functools.cache
+def _needles_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    # Longest needles first so overlapping alternatives report the most specific match.
+    return re.compile("|".join(re.escape(needle) for needle in sorted(needles, key=len, reverse=True)))
 
 
-def test_skip_images_default_includes_image_markdown(convert: Callable[..., str]) -> None:
-    """Verify that images are included by default when skip_images not specified."""
-    html = '<img src="https://example.com/image.jpg" alt="Test Image">'
-    result = convert(html)
-    assert "![Test Image](https://example.com/image.jpg)" in result
+def assert_contains_none(text: str, needles: Sequence[str]) -> None:
+    """Assert that none of the needles occur in text, using a single scan."""
+    match = _needles_pattern(tuple(needles)).search(text)
+    assert match is None, f"unexpected {match.group()!r} in {text!r}"
 
 
-def test_skip_images_simple_img_tag(convert: Callable[..., str]) -> None:
-    """Test skipping a simple <img> with src and alt attributes."""
-    html = '<p>Before <img src="image.jpg" alt="Picture"> after</p>'
-    result = convert(html, skip_images=True)
-    assert "Before" in result
-    assert "after" in result
-    assert "![Picture]" not in result
-    assert "image.jpg" not in result
+def assert_contains_all(text: str, needles: Sequence[str]) -> None:
+    """Assert that every needle occurs in text.
 
-
-def test_skip_images_simple_img_tag_default(convert: Callable[..., str]) -> None:
-    """Test that simple <img> is included by default."""
-    html = '<p>Before <img src="image.jpg" alt="Picture"> after</p>'
-    result = convert(html)
-    assert "![Picture](image.jpg)" in result
-    assert "Before" in result
-    assert "after" in result
-
-
-def test_skip_images_multiple_images_in_same_html(convert: Callable[..., str]) -> None:
-    """Test skipping multiple <img> elements in same HTML."""
-    html = """
-    <p>First <img src="image1.jpg" alt="Image 1"> image</p>
-    <p>Second <img src="image2.jpg" alt="Image 2"> image</p>
-    <p>Third <img src="image3.jpg" alt="Image 3"> image</p>
+    One scan collects the non-overlapping matches; only needles it did not report
+    (because they overlap another match) are checked individually.
     """
-    result = convert(html, skip_images=True)
-    assert "![Image 1]" not in result
-    assert "![Image 2]" not in result
-    assert "![Image 3]" not in result
-    assert "image1.jpg" not in result
-    assert "image2.jpg" not in result
-    assert "image3.jpg" not in result
-    assert "First" in result
-    assert "Second" in result
-    assert "Third" in result
-
-
-def test_skip_images_multiple_images_default(convert: Callable[..., str]) -> None:
-    """Test that multiple images are included by default."""
-    html = """
-    <p>First <img src="image1.jpg" alt="Image 1"> image</p>
-    <p>Second <img src="image2.jpg" alt="Image 2"> image</p>
-    <p>Third <img src="image3.jpg" alt="Image 3"> image</p>
-    """
-    result = convert(html)
-    assert "![Image 1](image1.jpg)" in result
-    assert "![Image 2](image2.jpg)" in result
-    assert "![Image 3](image3.jpg)" in result
+    found = set(_needles_pattern(tuple(needles)).findall(text))
+    missing = [needle for needle in needles if needle not in found and needle not in text]
+    assert not missing, f"missing {missing!r} in {text!r}"
 
 
-def test_skip_images_in_paragraph(convert: Callable[..., str]) -> None:
-    """Test skipping images inside paragraphs."""
-    html = "<p>Text with <img src='pic.jpg' alt='Picture'> in middle</p>"
-    result = convert(html, skip_images=True)
-    assert "Text with" in result
-    assert "in middle" in result
-    assert "![Picture]" not in result
-
-
-def test_skip_images_in_list(convert: Callable[..., str]) -> None:
-    """Test skipping images inside list items."""
-    html = """
+_IMG_BASIC = '<img src="https://example.com/image.jpg" alt="Test Image">'
+_IMG_WITHOUT_ALT = '<img src="image.jpg">'
+_TEXT_WITH_IMAGE = '<p>Text with <img src="image.jpg" alt="Image"> image</p>'
+_LIST_HTML = """
     <ul>
         <li>Item 1 <img src="img1.jpg" alt="Img 1"></li>
         <li>Item 2 <img src="img2.jpg" alt="Img 2"></li>
         <li>Item 3</li>
     </ul>
     """
-    result = convert(html, skip_images=True)
-    assert "- Item 1" in result or "- Item 1 " in result
-    assert "- Item 2" in result or "- Item 2 " in result
-    assert "- Item 3" in result
-    assert "![Img 1]" not in result
-    assert "![Img 2]" not in result
 
-
-def test_skip_images_in_list_default(convert: Callable[..., str]) -> None:
-    """Test that images in list items are included by default."""
-    html = """
-    <ul>
-        <li>Item 1 <img src="img1.jpg" alt="Img 1"></li>
-        <li>Item 2 <img src="img2.jpg" alt="Img 2"></li>
-        <li>Item 3</li>
-    </ul>
-    """
-    result = convert(html)
-    assert "![Img 1](img1.jpg)" in result
-    assert "![Img 2](img2.jpg)" in result
-
-
-def test_skip_images_in_table(convert: Callable[..., str]) -> None:
-    """Test skipping images inside table cells."""
-    html = """
-    <table>
-        <tr>
-            <th>Header</th>
-        </tr>
-        <tr>
-            <td>Cell with <img src="cell.jpg" alt="Cell Image"></td>
-        </tr>
-    </table>
-    """
-    result = convert(html, skip_images=True)
-    assert "Header" in result
-    assert "Cell with" in result
-    assert "![Cell Image]" not in result
-
-
-def test_skip_images_in_table_default(convert: Callable[..., str]) -> None:
-    """Test that images in tables are included by default."""
-    html = """
+_SNIPPETS = {
+    "basic": _IMG_BASIC,
+    "simple_img_tag": '<p>Before <img src="image.jpg" alt="Picture"> after</p>',
+    "multiple_images": """
+    <p>First <img src="image1.jpg" alt="Image 1"> image</p>
+    <p>Second <img src="image2.jpg" alt="Image 2"> image</p>
+    <p>Third <img src="image3.jpg" alt="Image 3"> image</p>
+    """,
+    "in_table": """
     <table>
         <tr>
             <th>Header</th>
@@ -170,206 +89,224 @@ def test_skip_images_in_table_default(convert: Callable[..., str]) -> None:
             <td>Cell with <img src="cell.jpg" alt="Cell Image"></td>
         </tr>
     </table>
-    """
-    result = convert(html)
-    assert "![Cell Image](cell.jpg)" in result
-
+    """,
+    "with_empty_alt": '<img src="image.jpg" alt="">',
+    "with_title_attribute": '<img src="image.jpg" alt="Alt Text" title="Title Text">',
+    "consecutive_images": (
+        '<img src="img1.jpg" alt="First"><img src="img2.jpg" alt="Second"><img src="img3.jpg" alt="Third">'
+    ),
+    "nested_in_link": '<a href="https://example.com"><img src="image.jpg" alt="Click me"></a>',
+    "in_figure": """
+    <figure>
+        <img src="image.jpg" alt="Figure Image">
+        <figcaption>This is a figure caption</figcaption>
+    </figure>
+    """,
+    "absolute_urls": '<img src="https://example.com/images/pic.jpg" alt="Picture">',
+    "in_heading": '<h1>Title <img src="badge.jpg" alt="Badge"> here</h1>',
+    "in_paragraph": "<p>Text with <img src='pic.jpg' alt='Picture'> in middle</p>",
+    "in_list": _LIST_HTML,
+    "surrounding_text": "<p>Start of paragraph <img src='image.jpg' alt='Middle Image'> end of paragraph</p>",
+    "surrounding_formatting": (
+        "<p>Text with <strong>bold</strong> <img src='img.jpg' alt='Img'> and <em>italic</em></p>"
+    ),
+    "surrounding_links": (
+        '<p>Visit <a href="https://example.com">our site</a> and see <img src="img.jpg" alt="Picture"></p>'
+    ),
+    "with_alt_text": '<img src="image.jpg" alt="Descriptive Alt Text">',
+    "without_alt": _IMG_WITHOUT_ALT,
+    "with_width_height": '<img src="image.jpg" alt="Image" width="100" height="100">',
+    "with_data_attributes": '<img src="image.jpg" alt="Image" data-id="123" data-type="featured">',
+    "with_class_attribute": '<img src="image.jpg" alt="Image" class="featured-image">',
+    "with_id_attribute": '<img src="image.jpg" alt="Image" id="main-image">',
+    "with_srcset_attribute": """<img
+        src="image.jpg"
+        alt="Responsive Image"
+        srcset="image-small.jpg 480w, image-medium.jpg 800w, image-large.jpg 1200w"
+    >""",
+    "with_multiple_attributes": """<img
+        id="main-img"
+        class="responsive featured"
+        src="https://example.com/images/photo.jpg?v=1"
+        alt="A photo with many attributes"
+        title="Hover text"
+        width="800"
+        height="600"
+        loading="lazy"
+        decoding="async"
+        data-src="backup.jpg"
+        data-id="12345"
+    >""",
+    "picture_element": """
+    <picture>
+        <source media="(min-width:800px)" srcset="large.jpg">
+        <img src="small.jpg" alt="Responsive">
+    </picture>
+    """,
+    "relative_urls": """
+    <p>Image 1: <img src="./images/pic1.jpg" alt="Pic1"></p>
+    <p>Image 2: <img src="../images/pic2.jpg" alt="Pic2"></p>
+    <p>Image 3: <img src="/images/pic3.jpg" alt="Pic3"></p>
+    """,
+    "relative_url": '<img src="./images/pic.jpg" alt="Picture">',
+    "data_uri": '<img src="data:image/png;base64,iVBORw0KGgo..." alt="Embedded">',
+    "whitespace_around": "<p>Text   <img src='image.jpg' alt='Image'>   more text</p>",
+    "newlines_around": """<p>
+        Before
+        <img src="image.jpg" alt="Image">
+        After
+    </p>""",
+    "only_images": '<img src="img1.jpg" alt="1"><img src="img2.jpg" alt="2">',
+    "short_article": """
+    <article>
+        <h1>Article Title</h1>
+        <img src="header.jpg" alt="Header Image">
+        <p>Introduction paragraph.</p>
+    </article>
+    """,
+}
 
-def test_skip_images_preserves_surrounding_text(convert: Callable[..., str]) -> None:
-    """Verify that surrounding content is preserved when images are skipped."""
-    html = "<p>Start of paragraph <img src='image.jpg' alt='Middle Image'> end of paragraph</p>"
-    result = convert(html, skip_images=True)
-    assert "Start of paragraph" in result
-    assert "end of paragraph" in result
-    assert "![Middle Image]" not in result
 
+@pytest.fixture(scope="session")
+def skip_images_handle() -> OptionsHandle:
+    return create_options_handle(ConversionOptions(skip_images=True))
 
-def test_skip_images_preserves_surrounding_formatting(convert: Callable[..., str]) -> None:
-    """Verify that surrounding formatting is preserved when images are skipped."""
-    html = "<p>Text with <strong>bold</strong> <img src='img.jpg' alt='Img'> and <em>italic</em></p>"
-    result = convert(html, skip_images=True)
-    assert "**bold**" in result
-    assert "*italic*" in result
-    assert "![Img]" not in result
 
+@pytest.fixture(scope="session")
+def default_handle() -> OptionsHandle:
+    return create_options_handle(ConversionOptions())
 
-def test_skip_images_with_alt_text(convert: Callable[..., str]) -> None:
-    """Verify that alt text is not included when images are skipped."""
-    html = '<img src="image.jpg" alt="Descriptive Alt Text">'
-    result = convert(html, skip_images=True)
-    assert "Descriptive Alt Text" not in result
-    assert "![Descriptive Alt Text]" not in result
 
+@pytest.fixture(scope="module")
+def skip_images_results() -> dict[str, tuple[str, str]]:
+    """Convert every paired snippet once with skip_images enabled and once with the defaults.
 
-def test_skip_images_with_empty_alt(convert: Callable[..., str]) -> None:
-    """Test skipping images with empty alt attribute."""
-    html = '<img src="image.jpg" alt="">'
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
+    Both handles disable preprocessing, matching the conftest convert fixture.
+    """
+    preprocessing = PreprocessingOptions(enabled=False)
+    skip_handle = create_options_handle(ConversionOptions(skip_images=True), preprocessing)
+    default = create_options_handle(ConversionOptions(), preprocessing)
+    return {
+        case: (convert_with_handle(html, skip_handle), convert_with_handle(html, default))
+        for case, html in _SNIPPETS.items()
+    }
+
+
+# (snippet, skip_images, expected substrings, forbidden substrings)
+_CASES: list[tuple[str, bool, list[str], list[str]]] = [
+    ("basic", True, [], ["![Test Image]", "https://example.com/image.jpg"]),
+    ("basic", False, ["![Test Image](https://example.com/image.jpg)"], []),
+    ("simple_img_tag", True, ["Before", "after"], ["![Picture]", "image.jpg"]),
+    ("simple_img_tag", False, ["![Picture](image.jpg)", "Before", "after"], []),
+    (
+        "multiple_images",
+        True,
+        ["First", "Second", "Third"],
+        ["![Image 1]", "![Image 2]", "![Image 3]", "image1.jpg", "image2.jpg", "image3.jpg"],
+    ),
+    (
+        "multiple_images",
+        False,
+        ["![Image 1](image1.jpg)", "![Image 2](image2.jpg)", "![Image 3](image3.jpg)"],
+        [],
+    ),
+    ("in_table", True, ["Header", "Cell with"], ["![Cell Image]"]),
+    ("in_table", False, ["![Cell Image](cell.jpg)"], []),
+    ("with_empty_alt", True, [], ["image.jpg"]),
+    ("with_empty_alt", False, ["![](image.jpg)"], []),
+    ("with_title_attribute", True, [], ["image.jpg", "Alt Text", "Title Text"]),
+    ("with_title_attribute", False, ["image.jpg"], []),
+    (
+        "consecutive_images",
+        True,
+        [],
+        ["![First]", "![Second]", "![Third]", "img1.jpg", "img2.jpg", "img3.jpg"],
+    ),
+    ("consecutive_images", False, ["![First](img1.jpg)", "![Second](img2.jpg)", "![Third](img3.jpg)"], []),
+    ("nested_in_link", True, [], ["![Click me]", "image.jpg"]),
+    ("nested_in_link", False, ["![Click me](image.jpg)"], []),
+    ("in_figure", True, ["This is a figure caption"], ["![Figure Image]", "image.jpg"]),
+    ("in_figure", False, ["![Figure Image](image.jpg)", "This is a figure caption"], []),
+    ("absolute_urls", True, [], ["![Picture]", "https://example.com/images/pic.jpg"]),
+    ("absolute_urls", False, ["![Picture](https://example.com/images/pic.jpg)"], []),
+    ("in_heading", True, ["Title", "here"], ["![Badge]"]),
+    # In headings, images are not converted to markdown syntax but their alt text is preserved
+    ("in_heading", False, ["Title", "Badge", "here"], []),
+    ("in_paragraph", True, ["Text with", "in middle"], ["![Picture]"]),
+    ("in_list", False, ["![Img 1](img1.jpg)", "![Img 2](img2.jpg)"], []),
+    ("surrounding_text", True, ["Start of paragraph", "end of paragraph"], ["![Middle Image]"]),
+    ("surrounding_formatting", True, ["**bold**", "*italic*"], ["![Img]"]),
+    ("surrounding_links", True, ["[our site](https://example.com)"], ["![Picture]"]),
+    ("with_alt_text", True, [], ["Descriptive Alt Text", "![Descriptive Alt Text]"]),
+    ("without_alt", True, [], ["image.jpg"]),
+    ("with_width_height", True, [], ["image.jpg", "width", "height"]),
+    ("with_data_attributes", True, [], ["image.jpg", "data-id", "data-type"]),
+    ("with_class_attribute", True, [], ["image.jpg", "featured-image"]),
+    ("with_id_attribute", True, [], ["image.jpg", "main-image"]),
+    ("with_srcset_attribute", True, [], ["image.jpg", "![Responsive Image]", "srcset"]),
+    (
+        "with_multiple_attributes",
+        True,
+        [],
+        ["https://example.com/images/photo.jpg", "![A photo with many attributes]", "main-img", "responsive"],
+    ),
+    ("picture_element", True, [], ["![Responsive]", "small.jpg", "large.jpg"]),
+    (
+        "relative_urls",
+        True,
+        [],
+        ["![Pic1]", "![Pic2]", "![Pic3]", "images/pic1.jpg", "images/pic2.jpg", "images/pic3.jpg"],
+    ),
+    ("relative_url", False, ["![Picture](./images/pic.jpg)"], []),
+    ("data_uri", True, [], ["![Embedded]", "data:image"]),
+    ("whitespace_around", True, ["Text", "more text"], ["![Image]"]),
+    ("newlines_around", True, ["Before", "After"], ["![Image]"]),
+    ("only_images", True, [], ["![1]", "![2]", "img1.jpg", "img2.jpg"]),
+    ("short_article", False, ["Article Title", "![Header Image](header.jpg)"], []),
+]
+
+
+@pytest.mark.parametrize(
+    ("case", "skip_images", "expected_contains", "expected_missing"),
+    [pytest.param(*case, id=f"{case[0]}-{'skip' if case[1] else 'default'}") for case in _CASES],
+)
+def test_skip_images_snippet(
+    skip_images_results: dict[str, tuple[str, str]],
+    case: str,
+    skip_images: bool,
+    expected_contains: list[str],
+    expected_missing: list[str],
+) -> None:
+    """Check the skip_images=True or default rendering of a shared snippet."""
+    skipped, default = skip_images_results[case]
+    result = skipped if skip_images else default
+    if expected_contains:
+        assert_contains_all(result, expected_contains)
+    if expected_missing:
+        assert_contains_none(result, expected_missing)
 
 
-def test_skip_images_with_empty_alt_default(convert: Callable[..., str]) -> None:
-    """Test that images with empty alt are included by default."""
-    html = '<img src="image.jpg" alt="">'
-    result = convert(html)
-    assert "![](image.jpg)" in result
+def test_skip_images_false_includes_image_markdown(convert: Callable[..., str]) -> None:
+    """Verify that images are included by default (skip_images=False)."""
+    result = convert(_IMG_BASIC, skip_images=False)
+    assert "![Test Image](https://example.com/image.jpg)" in result
 
 
-def test_skip_images_without_alt(convert: Callable[..., str]) -> None:
-    """Test skipping images without alt attribute."""
-    html = '<img src="image.jpg">'
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
+def test_skip_images_in_list(skip_images_results: dict[str, tuple[str, str]]) -> None:
+    """Test skipping images inside list items."""
+    result, _ = skip_images_results["in_list"]
+    assert set(_ITEM_PAT.findall(result)) == {"1", "2", "3"}
+    assert "![Img 1]" not in result
+    assert "![Img 2]" not in result
 
 
-def test_skip_images_without_alt_default(convert: Callable[..., str]) -> None:
+def test_skip_images_without_alt_default(skip_images_results: dict[str, tuple[str, str]]) -> None:
     """Test that images without alt are included by default."""
-    html = '<img src="image.jpg">'
-    result = convert(html)
-    assert "![](image.jpg)" in result or "image.jpg" in result
-
-
-def test_skip_images_with_title_attribute(convert: Callable[..., str]) -> None:
-    """Test skipping images with title attribute."""
-    html = '<img src="image.jpg" alt="Alt Text" title="Title Text">'
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
-    assert "Alt Text" not in result
-    assert "Title Text" not in result
-
-
-def test_skip_images_with_title_attribute_default(convert: Callable[..., str]) -> None:
-    """Test that images with title are included by default."""
-    html = '<img src="image.jpg" alt="Alt Text" title="Title Text">'
-    result = convert(html)
+    _, result = skip_images_results["without_alt"]
+    # "![](image.jpg)" contains "image.jpg", so one scan covers both renderings
     assert "image.jpg" in result
 
 
-def test_skip_images_with_width_height_attributes(convert: Callable[..., str]) -> None:
-    """Test skipping images with width and height attributes."""
-    html = '<img src="image.jpg" alt="Image" width="100" height="100">'
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
-    assert "width" not in result
-    assert "height" not in result
-
-
-def test_skip_images_with_data_attributes(convert: Callable[..., str]) -> None:
-    """Test skipping images with data attributes."""
-    html = '<img src="image.jpg" alt="Image" data-id="123" data-type="featured">'
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
-    assert "data-id" not in result
-    assert "data-type" not in result
-
-
-def test_skip_images_with_class_attribute(convert: Callable[..., str]) -> None:
-    """Test skipping images with class attribute."""
-    html = '<img src="image.jpg" alt="Image" class="featured-image">'
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
-    assert "featured-image" not in result
-
-
-def test_skip_images_with_id_attribute(convert: Callable[..., str]) -> None:
-    """Test skipping images with id attribute."""
-    html = '<img src="image.jpg" alt="Image" id="main-image">'
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
-    assert "main-image" not in result
-
-
-def test_skip_images_consecutive_images(convert: Callable[..., str]) -> None:
-    """Test skipping consecutive images without text between them."""
-    html = '<img src="img1.jpg" alt="First"><img src="img2.jpg" alt="Second"><img src="img3.jpg" alt="Third">'
-    result = convert(html, skip_images=True)
-    assert "![First]" not in result
-    assert "![Second]" not in result
-    assert "![Third]" not in result
-    assert "img1.jpg" not in result
-    assert "img2.jpg" not in result
-    assert "img3.jpg" not in result
-
-
-def test_skip_images_consecutive_images_default(convert: Callable[..., str]) -> None:
-    """Test that consecutive images are included by default."""
-    html = '<img src="img1.jpg" alt="First"><img src="img2.jpg" alt="Second"><img src="img3.jpg" alt="Third">'
-    result = convert(html)
-    assert "![First](img1.jpg)" in result
-    assert "![Second](img2.jpg)" in result
-    assert "![Third](img3.jpg)" in result
-
-
-def test_skip_images_nested_in_link(convert: Callable[..., str]) -> None:
-    """Test skipping images nested inside link elements."""
-    html = '<a href="https://example.com"><img src="image.jpg" alt="Click me"></a>'
-    result = convert(html, skip_images=True)
-    # The link should still be present but without the image
-    assert "![Click me]" not in result
-    assert "image.jpg" not in result
-
-
-def test_skip_images_nested_in_link_default(convert: Callable[..., str]) -> None:
-    """Test that images nested in links are included by default."""
-    html = '<a href="https://example.com"><img src="image.jpg" alt="Click me"></a>'
-    result = convert(html)
-    assert "![Click me](image.jpg)" in result
-
-
-def test_skip_images_with_srcset_attribute(convert: Callable[..., str]) -> None:
-    """Test skipping images with srcset attribute."""
-    html = """<img
-        src="image.jpg"
-        alt="Responsive Image"
-        srcset="image-small.jpg 480w, image-medium.jpg 800w, image-large.jpg 1200w"
-    >"""
-    result = convert(html, skip_images=True)
-    assert "image.jpg" not in result
-    assert "![Responsive Image]" not in result
-    assert "srcset" not in result
-
-
-def test_skip_images_with_picture_element(convert: Callable[..., str]) -> None:
-    """Test skipping images inside picture elements."""
-    html = """
-    <picture>
-        <source media="(min-width:800px)" srcset="large.jpg">
-        <img src="small.jpg" alt="Responsive">
-    </picture>
-    """
-    result = convert(html, skip_images=True)
-    assert "![Responsive]" not in result
-    assert "small.jpg" not in result
-    assert "large.jpg" not in result
-
-
-def test_skip_images_in_figure(convert: Callable[..., str]) -> None:
-    """Test skipping images inside figure elements."""
-    html = """
-    <figure>
-        <img src="image.jpg" alt="Figure Image">
-        <figcaption>This is a figure caption</figcaption>
-    </figure>
-    """
-    result = convert(html, skip_images=True)
-    assert "![Figure Image]" not in result
-    assert "image.jpg" not in result
-    assert "This is a figure caption" in result
-
-
-def test_skip_images_in_figure_default(convert: Callable[..., str]) -> None:
-    """Test that images in figures are included by default."""
-    html = """
-    <figure>
-        <img src="image.jpg" alt="Figure Image">
-        <figcaption>This is a figure caption</figcaption>
-    </figure>
-    """
-    result = convert(html)
-    assert "![Figure Image](image.jpg)" in result
-    assert "This is a figure caption" in result
-
-
 def test_skip_images_complex_document(convert: Callable[..., str]) -> None:
     """Test skipping images in a complex document with mixed content."""
     html = """
@@ -388,125 +325,26 @@ def test_skip_images_complex_document(convert: Callable[..., str]) -> None:
     </article>
     """
     result = convert(html, skip_images=True)
-    assert "Article Title" in result
-    assert "Introduction paragraph with" in result
-    assert "image" in result.lower()
-    assert "Section" in result
-    assert "More content" in result
-    assert "Footer with" in result
-    assert "![Header Image]" not in result
-    assert "![Inline]" not in result
-    assert "![Section Image]" not in result
-    assert "![Footer]" not in result
-    assert "header.jpg" not in result
-    assert "inline.jpg" not in result
-    assert "section.jpg" not in result
-    assert "footer.jpg" not in result
-
-
-def test_skip_images_complex_document_default(convert: Callable[..., str]) -> None:
-    """Test that images in complex documents are included by default."""
-    html = """
-    <article>
-        <h1>Article Title</h1>
-        <img src="header.jpg" alt="Header Image">
-        <p>Introduction paragraph.</p>
-    </article>
-    """
-    result = convert(html)
-    assert "Article Title" in result
-    assert "![Header Image](header.jpg)" in result
-
-
-def test_skip_images_with_relative_urls(convert: Callable[..., str]) -> None:
-    """Test skipping images with relative URLs."""
-    html = """
-    <p>Image 1: <img src="./images/pic1.jpg" alt="Pic1"></p>
-    <p>Image 2: <img src="../images/pic2.jpg" alt="Pic2"></p>
-    <p>Image 3: <img src="/images/pic3.jpg" alt="Pic3"></p>
-    """
-    result = convert(html, skip_images=True)
-    assert "![Pic1]" not in result
-    assert "![Pic2]" not in result
-    assert "![Pic3]" not in result
-    assert "images/pic1.jpg" not in result
-    assert "images/pic2.jpg" not in result
-    assert "images/pic3.jpg" not in result
-
-
-def test_skip_images_with_relative_urls_default(convert: Callable[..., str]) -> None:
-    """Test that images with relative URLs are included by default."""
-    html = '<img src="./images/pic.jpg" alt="Picture">'
-    result = convert(html)
-    assert "![Picture](./images/pic.jpg)" in result
-
-
-def test_skip_images_with_absolute_urls(convert: Callable[..., str]) -> None:
-    """Test skipping images with absolute URLs."""
-    html = '<img src="https://example.com/images/pic.jpg" alt="Picture">'
-    result = convert(html, skip_images=True)
-    assert "![Picture]" not in result
-    assert "https://example.com/images/pic.jpg" not in result
-
-
-def test_skip_images_with_absolute_urls_default(convert: Callable[..., str]) -> None:
-    """Test that images with absolute URLs are included by default."""
-    html = '<img src="https://example.com/images/pic.jpg" alt="Picture">'
-    result = convert(html)
-    assert "![Picture](https://example.com/images/pic.jpg)" in result
-
-
-def test_skip_images_with_data_uri(convert: Callable[..., str]) -> None:
-    """Test skipping images with data URI."""
-    html = '<img src="data:image/png;base64,iVBORw0KGgo..." alt="Embedded">'
-    result = convert(html, skip_images=True)
-    assert "![Embedded]" not in result
-    assert "data:image" not in result
-
-
-def test_skip_images_whitespace_around_image(convert: Callable[..., str]) -> None:
-    """Test skipping images with whitespace around them."""
-    html = "<p>Text   <img src='image.jpg' alt='Image'>   more text</p>"
-    result = convert(html, skip_images=True)
-    assert "Text" in result
-    assert "more text" in result
-    assert "![Image]" not in result
-
-
-def test_skip_images_newlines_around_image(convert: Callable[..., str]) -> None:
-    """Test skipping images with newlines around them."""
-    html = """<p>
-        Before
-        <img src="image.jpg" alt="Image">
-        After
-    </p>"""
-    result = convert(html, skip_images=True)
-    assert "Before" in result
-    assert "After" in result
-    assert "![Image]" not in result
-
-
-def test_skip_images_in_heading(convert: Callable[..., str]) -> None:
-    """Test skipping images inside headings."""
-    html = '<h1>Title <img src="badge.jpg" alt="Badge"> here</h1>'
-    result = convert(html, skip_images=True)
-    assert "Title" in result
-    assert "here" in result
-    assert "![Badge]" not in result
-
-
-def test_skip_images_in_heading_default(convert: Callable[..., str]) -> None:
-    """Test that images in headings use alt text by default."""
-    html = '<h1>Title <img src="badge.jpg" alt="Badge"> here</h1>'
-    result = convert(html)
-    assert "Title" in result
-    assert "Badge" in result
-    # In headings, images are typically not converted to markdown syntax
-    # but their alt text is preserved
-    assert "here" in result
+    assert_contains_all(
+        result, ["Article Title", "Introduction paragraph with", "Section", "More content", "Footer with"]
+    )
+    assert _IMAGE_CI.search(result)
+    assert_contains_none(
+        result,
+        [
+            "![Header Image]",
+            "![Inline]",
+            "![Section Image]",
+            "![Footer]",
+            "header.jpg",
+            "inline.jpg",
+            "section.jpg",
+            "footer.jpg",
+        ],
+    )
 
 
-def test_skip_images_integration_with_metadata(convert: Callable[..., str]) -> None:
+def test_skip_images_integration_with_metadata() -> None:
     """Test integration with convert_with_metadata.
 
     Images should be skipped in markdown but still captured in metadata.
@@ -532,26 +370,18 @@ def test_skip_images_integration_with_metadata(convert: Callable[..., str]) -> N
     assert "here" in markdown
 
 
-def test_skip_images_with_options_handle(convert: Callable[..., str]) -> None:
+def test_skip_images_with_options_handle(skip_images_handle: OptionsHandle) -> None:
     """Test skip_images with create_options_handle."""
-    html = '<p>Text with <img src="image.jpg" alt="Image"> image</p>'
-
-    # Create handle with skip_images=True
-    handle = create_options_handle(ConversionOptions(skip_images=True))
-    result = convert_with_handle(html, handle)
+    result = convert_with_handle(_TEXT_WITH_IMAGE, skip_images_handle)
 
     assert "Text with" in result
     assert "![Image]" not in result
     assert "image.jpg" not in result
 
 
-def test_skip_images_with_options_handle_default(convert: Callable[..., str]) -> None:
+def test_skip_images_with_options_handle_default(default_handle: OptionsHandle) -> None:
     """Test that images are included by default with options handle."""
-    html = '<p>Text with <img src="image.jpg" alt="Image"> image</p>'
-
-    # Create handle without skip_images (defaults to False)
-    handle = create_options_handle(ConversionOptions())
-    result = convert_with_handle(html, handle)
+    result = convert_with_handle(_TEXT_WITH_IMAGE, default_handle)
 
     assert "![Image](image.jpg)" in result
 
@@ -563,17 +393,6 @@ def test_skip_images_empty_document(convert: Callable[..., str]) -> None:
     assert result == ""
 
 
-def test_skip_images_only_images(convert: Callable[..., str]) -> None:
-    """Test skip_images when document contains only images."""
-    html = '<img src="img1.jpg" alt="1"><img src="img2.jpg" alt="2">'
-    result = convert(html, skip_images=True)
-    # Should result in empty or whitespace-only markdown
-    assert "![1]" not in result
-    assert "![2]" not in result
-    assert "img1.jpg" not in result
-    assert "img2.jpg" not in result
-
-
 def test_skip_images_mixed_with_other_options(convert: Callable[..., str]) -> None:
     """Test skip_images in combination with other conversion options."""
     html = """
@@ -589,33 +408,3 @@ def test_skip_images_mixed_with_other_options(convert: Callable[..., str]) -> No
     assert "# Title #" in result
     assert "**bold**" in result
     assert "![Image]" not in result
-
-
-def test_skip_images_preserves_surrounding_links(convert: Callable[..., str]) -> None:
-    """Test that surrounding links are preserved when images are skipped."""
-    html = '<p>Visit <a href="https://example.com">our site</a> and see <img src="img.jpg" alt="Picture"></p>'
-    result = convert(html, skip_images=True)
-    assert "[our site](https://example.com)" in result
-    assert "![Picture]" not in result
-
-
-def test_skip_images_with_multiple_attributes_complex(convert: Callable[..., str]) -> None:
-    """Test skipping images with complex multiple attributes."""
-    html = """<img
-        id="main-img"
-        class="responsive featured"
-        src="https://example.com/images/photo.jpg?v=1"
-        alt="A photo with many attributes"
-        title="Hover text"
-        width="800"
-        height="600"
-        loading="lazy"
-        decoding="async"
-        data-src="backup.jpg"
-        data-id="12345"
-    >"""
-    result = convert(html, skip_images=True)
-    assert "https://example.com/images/photo.jpg" not in result
-    assert "![A photo with many attributes]" not in result
-    assert "main-img" not in result
-    assert "responsive" not in result
@@ -10,14 +10,30 @@ This script reads the version from Cargo.toml [workspace.package] and updates:
 - Cargo.toml files with hardcoded versions (not using workspace)
 """
 
+import functools
+import io
 import json
+import os
 import re
 import sys
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
 
+try:
+    import tomllib  # Python 3.11+  # type: ignore[import-not-found]
+except ImportError:
+    import tomli as tomllib  # Python 3.10  # type: ignore[import-not-found]
+
+
+@functools.cache
 def get_repo_root() -> Path:
     """Get the repository root directory."""
     script_dir = Path(__file__).resolve().parent
@@ -27,16 +43,102 @@ def get_repo_root() -> Path:
 def get_workspace_version(repo_root: Path) -> str:
     """Extract version from Cargo.toml [workspace.package]."""
     cargo_toml = repo_root / "Cargo.toml"
-    if not cargo_toml.exists():
-        raise FileNotFoundError(f"Cargo.toml not found at {cargo_toml}")
-
-    content = cargo_toml.read_text()
-    match = re.search(r'^\[workspace\.package\]\s*\nversion\s*=\s*"([^"]+)"', content, re.MULTILINE)
+    try:
+        with cargo_toml.open("rb") as f:
+            cargo = tomllib.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Cargo.toml not found at {cargo_toml}") from None
 
-    if not match:
+    version = cargo.get("workspace", {}).get("package", {}).get("version")
+    if not isinstance(version, str):
         raise ValueError("Could not find version in Cargo.toml [workspace.package]")
 
-    return match.group(1)
+    return version
+
+
+# ============================================================================
+# Precompiled Patterns
+# ============================================================================
+
+_RUST_DEPENDENCY_PREFIX = "html-to-markdown-"
+_HARDCODED_CARGO_VERSION_RE = re.compile(r'^version\s*=\s*"[^"]+"', re.MULTILINE)
+_GEMFILE_LOCK_RE = re.compile(r"(html-to-markdown\s*\()\s*([^)]+)(\))")
+_PY_VERSION_RE = re.compile(r'(__version__\s*=\s*)"([^"]+)"')
+# Either the `bindingPackageVersion !== 'X.Y.Z'` guard or the `expected X.Y.Z but` error message
+_NODE_BINDING_RE = re.compile(
+    r"(?P<guard>bindingPackageVersion\s*!==\s*')[0-9]+\.[0-9]+\.[0-9]+(?P<guard_end>')"
+    r"|(?P<expected>expected\s+)[0-9]+\.[0-9]+\.[0-9]+(?P<expected_end>\s+but)"
+)
+_UV_LOCK_RE = re.compile(r'(name\s*=\s*"html-to-markdown"\s+version\s*=\s*)"([^"]+)"')
+_MIX_VERSION_RE = re.compile(r'(@version\s*=?\s*)"([^"]+)"')
+# Linear-time XML patterns: no `.` or lazy gaps, so no DOTALL needed and no backtracking across elements
+_CSPROJ_VERSION_RE = re.compile(r"(<Version>)([^<]+)(</Version>)")
+_POM_VERSION_RE = re.compile(
+    r"(<artifactId>\s*html-to-markdown\s*</artifactId>\s*<version>)([^<]+)(</version>)", re.IGNORECASE
+)
+_POM_DEPENDENCY_VERSION_RE = re.compile(r"(<version>)[^<]*(</version>)")
+
+
+@dataclass(slots=True, frozen=True)
+class _FieldPatterns:
+    quote: str
+    extract: re.Pattern[str]
+    replace: re.Pattern[str]
+    # Literal field name and anchoring for the str.find fast path
+    literal: str
+    line_start: bool
+
+
+def _compile_field_patterns(field_pattern: str, quote_char: str, *, literal: str, line_start: bool) -> _FieldPatterns:
+    """
+    Compile the patterns for a quoted field like `version = "X.Y.Z"`.
+
+    Args:
+        field_pattern: Pattern like r'^version\\s*=' (capture group added automatically)
+        quote_char: Quote character around the value
+        literal: Field name as plain text, used by the str.find fast path
+        line_start: Whether the field must start a line (matches a leading ^ in field_pattern)
+    """
+    quote_esc = re.escape(quote_char)
+    return _FieldPatterns(
+        quote=quote_char,
+        # Full pattern with capture group for extraction
+        extract=re.compile(field_pattern + rf"\s*{quote_esc}([^{quote_esc}]+){quote_esc}", re.MULTILINE),
+        # Replacement pattern that captures everything up to the opening quote and the closing quote
+        replace=re.compile(f"({field_pattern}" + rf"\s*{quote_esc})[^{quote_esc}]+({quote_esc})", re.MULTILINE),
+        literal=literal,
+        line_start=line_start,
+    )
+
+
+# Fields with fixed patterns are compiled once at import
+_TOML_VERSION_FIELD = _compile_field_patterns(r"^version\s*=", '"', literal="version", line_start=True)
+_RUBY_VERSION_FIELD = _compile_field_patterns(r"VERSION\s*=", "'", literal="VERSION", line_start=False)
+
+
+@functools.lru_cache(maxsize=256)
+def _toml_dependency_pattern(package_name: str) -> re.Pattern[str]:
+    return re.compile(rf'({re.escape(package_name)}\s*=\s*)"[^"]+"')
+
+
+@functools.lru_cache(maxsize=256)
+def _gemfile_dependency_pattern(gem_name: str) -> re.Pattern[str]:
+    return re.compile(rf"gem\s+['\"]?{re.escape(gem_name)}['\"]?.*")
+
+
+@functools.lru_cache(maxsize=256)
+def _go_mod_pattern(module_path: str) -> re.Pattern[str]:
+    return re.compile(rf"{re.escape(module_path)}\s+v[\d\.]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _csproj_dependency_pattern(package_name: str) -> re.Pattern[str]:
+    return re.compile(rf'(<PackageReference\s+Include="{re.escape(package_name)}"\s+Version=")[^"]+(")')
+
+
+@functools.lru_cache(maxsize=256)
+def _mix_dependency_pattern(package_name: str) -> re.Pattern[str]:
+    return re.compile(rf'(\{{{re.escape(package_name)},\s*"~>\s*)[^"]+("}})')
 
 
 # ============================================================================
@@ -44,7 +146,32 @@ def get_workspace_version(repo_root: Path) -> str:
 # ============================================================================
 
 
-def _extract_version_regex(content: str, pattern: str) -> str:
+def _read(path: Path) -> str:
+    # Manifests are UTF-8; decoding bytes directly skips the text IO layer and keeps line endings as they are
+    return path.read_bytes().decode("utf-8")
+
+
+def _write(path: Path, content: str) -> None:
+    path.write_bytes(content.encode("utf-8"))
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(_read(path))
+
+
+def _write_json(path: Path, data: Any) -> None:
+    if orjson is not None:
+        dumped = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        # json.dumps escapes non-ASCII characters; only keep orjson's output when the bytes are identical
+        if dumped.isascii():
+            path.write_bytes(dumped + b"\n")
+            return
+    _write(path, json.dumps(data, indent=2) + "\n")
+
+
+def _extract_version_regex(content: str, pattern: str | re.Pattern[str]) -> str:
     """Extract version from content using regex pattern with capturing group."""
     match = re.search(pattern, content)
     return match.group(1) if match else "NOT FOUND"
@@ -64,7 +191,7 @@ def _update_via_regex(
 
     Returns: (changed, old_version, new_version)
     """
-    content = file_path.read_text()
+    content = _read(file_path)
     old_version = _extract_version_regex(content, pattern)
 
     if isinstance(replacement_fn, str):
@@ -74,50 +201,118 @@ def _update_via_regex(
 
     changed = num_replaced > 0 and new_content != content
     if changed:
-        file_path.write_text(new_content)
+        _write(file_path, new_content)
 
     return changed, old_version, old_version  # old_version used as placeholder until actual new version is extracted
 
 
+def _skip_whitespace(content: str, pos: int) -> int:
+    while pos < len(content) and content[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _find_quoted_field(content: str, field: str, quote: str, *, line_start: bool) -> tuple[int, int] | None:
+    """
+    Locate the quoted value of `field = "value"` with plain string scans.
+
+    Returns the (start, end) span of the value, or None when the field is missing, malformed or occurs more than
+    once, so callers can fall back to the regex path.
+    """
+    needle = f"\n{field}" if line_start else field
+    if line_start and content.startswith(field):
+        pos = 0
+    else:
+        pos = content.find(needle)
+        if pos == -1:
+            return None
+        if line_start:
+            pos += 1
+
+    pos += len(field)
+    if content.find(needle, pos) != -1:
+        return None
+
+    pos = _skip_whitespace(content, pos)
+    if not content.startswith("=", pos):
+        return None
+    pos = _skip_whitespace(content, pos + 1)
+    if not content.startswith(quote, pos):
+        return None
+
+    start = pos + 1
+    end = content.find(quote, start)
+    if end <= start:
+        return None
+    return start, end
+
+
+def _replace_single_regex_field(
+    content: str, patterns: _FieldPatterns, version: str, count: int = 1
+) -> tuple[str, str]:
+    """
+    Replace a single quoted field in already-loaded content (e.g., "version = "X.Y.Z"").
+
+    Args:
+        content: File content
+        patterns: Compiled field patterns from _compile_field_patterns
+        version: New version value
+        count: Max replacements
+
+    Returns: (new_content, old_version)
+    """
+    if count == 1:
+        span = _find_quoted_field(content, patterns.literal, patterns.quote, line_start=patterns.line_start)
+        if span is not None:
+            start, end = span
+            old_version = content[start:end]
+            if old_version == version:
+                return content, old_version
+            return f"{content[:start]}{version}{content[end:]}", old_version
+
+    old_version = _extract_version_regex(content, patterns.extract)
+
+    if old_version == version:
+        return content, old_version
+
+    return patterns.replace.sub(rf"\g<1>{version}\g<2>", content, count=count), old_version
+
+
 def _update_single_regex_field(
-    file_path: Path, field_pattern: str, version: str, quote_char: str = '"', count: int = 1
+    file_path: Path, patterns: _FieldPatterns, version: str, count: int = 1
 ) -> tuple[bool, str, str]:
     """
     Update single field via regex (e.g., "version = "X.Y.Z"").
 
     Args:
         file_path: Path to file
-        field_pattern: Pattern like r'^version\\s*=' (capture group added automatically)
+        patterns: Compiled field patterns from _compile_field_patterns
         version: New version value
-        quote_char: Quote character to use (default: ")
         count: Max replacements
 
     Returns: (changed, old_version, new_version)
     """
-    content = file_path.read_text()
-    # Build full pattern with capture group for extraction
-    quote_esc = re.escape(quote_char)
-    extract_pattern = field_pattern + rf"\s*{quote_esc}([^{quote_esc}]+){quote_esc}"
-    old_version = _extract_version_regex(content, extract_pattern)
-
-    if old_version == version:
-        return False, old_version, version
-
-    # Build replacement pattern that captures the field and replaces the quoted version
-    replacement_pattern = f"({field_pattern})" + rf"\s*{quote_esc}[^{quote_esc}]+{quote_esc}"
-    replacement_text = rf"\1{quote_char}{version}{quote_char}"
-    new_content = re.sub(replacement_pattern, replacement_text, content, count=count, flags=re.MULTILINE)
+    content = _read(file_path)
+    new_content, old_version = _replace_single_regex_field(content, patterns, version, count)
 
     if new_content != content:
-        file_path.write_text(new_content)
+        _write(file_path, new_content)
         return True, old_version, version
 
     return False, old_version, version
 
 
+def _write_if_changed(file_path: Path, content: str, updated: str) -> bool:
+    """Write updated content only when it differs from what was read. Returns whether the file changed."""
+    if updated == content:
+        return False
+    _write(file_path, updated)
+    return True
+
+
 def _update_json_field(file_path: Path, field: str, version: str) -> tuple[bool, str, str]:
     """Update a JSON field (e.g., "version" in package.json)."""
-    data = json.loads(file_path.read_text())
+    data = _read_json(file_path)
     old_version = data.get(field, "N/A")
     changed = False
 
@@ -126,21 +321,26 @@ def _update_json_field(file_path: Path, field: str, version: str) -> tuple[bool,
         changed = True
 
     if changed:
-        file_path.write_text(json.dumps(data, indent=2) + "\n")
+        _write_json(file_path, data)
 
     return changed, old_version, version
 
 
-def _update_json_dependency(file_path: Path, package_name: str, version_spec: str) -> None:
+def _update_json_dependency(file_path: Path, package_name: str, version_spec: str) -> bool:
     """Update dependency version in JSON files (package.json, composer.json)."""
-    data = json.loads(file_path.read_text())
+    data = _read_json(file_path)
+    changed = False
 
     # Check all possible dependency fields
     for dep_type in ["dependencies", "optionalDependencies", "devDependencies", "require"]:
-        if dep_type in data and package_name in data[dep_type]:
+        if dep_type in data and package_name in data[dep_type] and data[dep_type][package_name] != version_spec:
             data[dep_type][package_name] = version_spec
+            changed = True
 
-    file_path.write_text(json.dumps(data, indent=2) + "\n")
+    if changed:
+        _write_json(file_path, data)
+
+    return changed
 
 
 def update_package_json(file_path: Path, version: str) -> tuple[bool, str, str]:
@@ -150,49 +350,89 @@ def update_package_json(file_path: Path, version: str) -> tuple[bool, str, str]:
 
 def update_pyproject_toml(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update a pyproject.toml file."""
-    return _update_single_regex_field(file_path, r"^version\s*=", version, quote_char='"')
+    return _update_single_regex_field(file_path, _TOML_VERSION_FIELD, version)
 
 
 def update_ruby_version(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update Ruby version.rb file."""
-    return _update_single_regex_field(file_path, r"VERSION\s*=", version, quote_char="'")
+    return _update_single_regex_field(file_path, _RUBY_VERSION_FIELD, version)
 
 
-def update_cargo_toml(file_path: Path, version: str) -> tuple[bool, str, str]:
-    """Update a Cargo.toml file that has hardcoded version (not using workspace)."""
-    return _update_single_regex_field(file_path, r"^version\s*=", version, quote_char='"')
+def replace_cargo_version(content: str, version: str) -> tuple[str, str]:
+    """Replace the hardcoded package version in Cargo.toml content. Returns (new_content, old_version)."""
+    return _replace_single_regex_field(content, _TOML_VERSION_FIELD, version)
 
 
-def update_rust_dependency_versions(file_path: Path, version: str) -> bool:
-    """Update html-to-markdown-* workspace dependency version pins inside Cargo manifests."""
-    content = file_path.read_text()
+def _find_rust_dependency_version(content: str, start: int) -> tuple[int, int] | None:
+    """
+    Find the version pin of an `html-to-markdown-xxx = { ... version = "X.Y.Z" ... }` entry starting at start.
 
-    # Match all html-to-markdown-* dependencies with explicit version pins
-    # This pattern matches: html-to-markdown-xxx = { ... version = "X.Y.Z" ... }
-    # It handles cases with path, features, and other attributes in any order
-    pattern = re.compile(
-        r'(html-to-markdown-[a-z\-]+\s*=\s*\{[^}]*?version\s*=\s*")([^"]+)(")', re.MULTILINE | re.DOTALL
-    )
+    Returns the (start, end) span of the quoted version, or None if the entry has no inline version pin.
+    """
+    pos = name_end = start + len(_RUST_DEPENDENCY_PREFIX)
+    while name_end < len(content) and (content[name_end] == "-" or "a" <= content[name_end] <= "z"):
+        name_end += 1
+    if name_end == pos:
+        return None
+
+    pos = _skip_whitespace(content, name_end)
+    if not content.startswith("=", pos):
+        return None
+    pos = _skip_whitespace(content, pos + 1)
+    if not content.startswith("{", pos):
+        return None
+
+    # The version key has to appear before the inline table closes; path or features may come first
+    table_end = content.find("}", pos)
+    if table_end == -1:
+        table_end = len(content)
+
+    key = content.find("version", pos + 1, table_end)
+    while key != -1:
+        value_start = _skip_whitespace(content, key + len("version"))
+        if content.startswith("=", value_start):
+            value_start = _skip_whitespace(content, value_start + 1)
+            if content.startswith('"', value_start):
+                value_end = content.find('"', value_start + 1)
+                if value_end > value_start + 1:
+                    return value_start + 1, value_end
+        key = content.find("version", key + 1, table_end)
+
+    return None
+
+
+def replace_rust_dependency_versions(content: str, version: str) -> tuple[str, int]:
+    """Replace html-to-markdown-* dependency version pins in Cargo.toml content. Returns (new_content, count)."""
+    # Scan each html-to-markdown-* entry directly; entries without an inline version pin are skipped
+    parts: list[str] = []
+    count = 0
+    pos = search = 0
+    while (start := content.find(_RUST_DEPENDENCY_PREFIX, search)) != -1:
+        span = _find_rust_dependency_version(content, start)
+        if span is None:
+            search = start + 1
+            continue
 
-    def repl(match: re.Match[str]) -> str:
-        old_version = match.group(2)
+        value_start, value_end = span
         # Preserve exact version pin prefix (=) if present
         # This is important for standalone builds like Ruby gems
-        prefix = "=" if old_version.startswith("=") else ""
-        return f"{match.group(1)}{prefix}{version}{match.group(3)}"
+        prefix = "=" if content.startswith("=", value_start) else ""
+        parts.append(content[pos:value_start])
+        parts.append(f"{prefix}{version}")
+        pos = search = value_end
+        count += 1
 
-    new_content, count = pattern.subn(repl, content)
     if count == 0:
-        return False
+        return content, 0
 
-    file_path.write_text(new_content)
-    return True
+    parts.append(content[pos:])
+    return "".join(parts), count
 
 
 def update_gemfile_lock(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update html-to-markdown version in Gemfile.lock."""
-    content = file_path.read_text()
-    match = re.search(r"(html-to-markdown\s*\()\s*([^)]+)(\))", content)
+    content = _read(file_path)
+    match = _GEMFILE_LOCK_RE.search(content)
     if not match:
         return False, "NOT FOUND", version
 
@@ -200,50 +440,48 @@ def update_gemfile_lock(file_path: Path, version: str) -> tuple[bool, str, str]:
     if old_version == version:
         return False, old_version, version
 
-    new_content = re.sub(
-        r"(html-to-markdown\s*\()\s*([^)]+)(\))",
-        lambda m: f"{m.group(1)}{version}{m.group(3)}",
-        content,
-        count=1,
-    )
-    file_path.write_text(new_content)
+    new_content = _GEMFILE_LOCK_RE.sub(rf"\g<1>{version}\g<3>", content, count=1)
+    _write(file_path, new_content)
     return True, old_version, version
 
 
 def update_python_version_file(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update __version__ in Python __init__.py files."""
-    content = file_path.read_text()
-    match = re.search(r'(__version__\s*=\s*)"([^"]+)"', content)
+    content = _read(file_path)
+    match = _PY_VERSION_RE.search(content)
     old_version = match.group(2) if match else "NOT FOUND"
 
     if old_version == version:
         return False, old_version, version
 
-    new_content = re.sub(r'(__version__\s*=\s*)"([^"]+)"', rf'\1"{version}"', content, count=1)
-    file_path.write_text(new_content)
+    new_content = _PY_VERSION_RE.sub(rf'\1"{version}"', content, count=1)
+    _write(file_path, new_content)
     return True, old_version, version
 
 
 def update_node_binding_version(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update version checks in Node binding index.js file."""
-    content = file_path.read_text()
-    pattern = r"(bindingPackageVersion\s*!==\s*')([0-9]+\.[0-9]+\.[0-9]+)(')"
-    new_content, count = re.subn(pattern, rf"\g<1>{version}\g<3>", content)
-    new_content, count_expected = re.subn(
-        r"(expected\s+)([0-9]+\.[0-9]+\.[0-9]+)(\s+but)", rf"\g<1>{version}\g<3>", new_content
-    )
-    if count == 0 and count_expected == 0:
+    content = _read(file_path)
+    if "bindingPackageVersion" not in content and "expected" not in content:
+        return False, "N/A", version
+
+    def repl(match: re.Match[str]) -> str:
+        if match.lastgroup == "guard_end":
+            return f"{match['guard']}{version}{match['guard_end']}"
+        return f"{match['expected']}{version}{match['expected_end']}"
+
+    new_content, count = _NODE_BINDING_RE.subn(repl, content)
+    if count == 0:
         return False, "N/A", version
 
-    file_path.write_text(new_content)
+    _write(file_path, new_content)
     return True, "Updated node binding checks", version
 
 
 def update_uv_lock(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update html-to-markdown version in uv.lock file."""
-    content = file_path.read_text()
-    pattern = re.compile(r'(name\s*=\s*"html-to-markdown"\s+version\s*=\s*)"([^"]+)"')
-    match = pattern.search(content)
+    content = _read(file_path)
+    match = _UV_LOCK_RE.search(content)
     if not match:
         return False, "NOT FOUND", version
 
@@ -251,8 +489,8 @@ def update_uv_lock(file_path: Path, version: str) -> tuple[bool, str, str]:
     if old_version == version:
         return False, old_version, version
 
-    new_content = pattern.sub(lambda m: f'{m.group(1)}"{version}"', content, count=1)
-    file_path.write_text(new_content)
+    new_content = _UV_LOCK_RE.sub(rf'\g<1>"{version}"', content, count=1)
+    _write(file_path, new_content)
     return True, old_version, version
 
 
@@ -261,116 +499,124 @@ def update_composer_json(file_path: Path, version: str) -> tuple[bool, str, str]
     return _update_json_field(file_path, "version", version)
 
 
-def update_json_dependency(file_path: Path, package_name: str, version_spec: str) -> None:
+def update_json_dependency(file_path: Path, package_name: str, version_spec: str) -> bool:
     """Update dependency version in JSON files (package.json, composer.json)."""
-    _update_json_dependency(file_path, package_name, version_spec)
+    return _update_json_dependency(file_path, package_name, version_spec)
 
 
-def update_toml_dependency(file_path: Path, package_name: str, version_spec: str) -> None:
+def update_toml_dependency(file_path: Path, package_name: str, version_spec: str) -> bool:
     """Update dependency version in pyproject.toml."""
-    content = file_path.read_text()
-    pattern = re.compile(rf'({re.escape(package_name)}\s*=\s*)"[^"]+"')
-    updated = pattern.sub(rf'\1"{version_spec}"', content)
-    file_path.write_text(updated)
+    content = _read(file_path)
+    updated = _toml_dependency_pattern(package_name).sub(rf'\1"{version_spec}"', content)
+    return _write_if_changed(file_path, content, updated)
 
 
-def update_gemfile_dependency(gemfile_path: Path, gem_name: str, version: str) -> None:
+def update_gemfile_dependency(gemfile_path: Path, gem_name: str, version: str) -> bool:
     """Update gem version in Gemfile."""
-    content = gemfile_path.read_text()
-    pattern = re.compile(rf"gem\s+['\"]?{re.escape(gem_name)}['\"]?.*")
+    content = _read(gemfile_path)
     replacement = f"gem '{gem_name}', '{version}'"
-    updated = pattern.sub(replacement, content)
-    gemfile_path.write_text(updated)
+    updated = _gemfile_dependency_pattern(gem_name).sub(replacement, content)
+    return _write_if_changed(gemfile_path, content, updated)
 
 
-def update_go_mod(go_mod_path: Path, module_path: str, version: str) -> None:
+def update_go_mod(go_mod_path: Path, module_path: str, version: str) -> bool:
     """Update module version in go.mod."""
-    content = go_mod_path.read_text()
-    pattern = re.compile(rf"{re.escape(module_path)}\s+v[\d\.]+")
+    content = _read(go_mod_path)
     replacement = f"{module_path} v{version}"
-    updated = pattern.sub(replacement, content)
-    go_mod_path.write_text(updated)
+    updated = _go_mod_pattern(module_path).sub(replacement, content)
+    return _write_if_changed(go_mod_path, content, updated)
 
 
-def update_pom_dependency(pom_path: Path, group_id: str, artifact_id: str, version: str) -> None:
+def update_pom_dependency(pom_path: Path, group_id: str, artifact_id: str, version: str) -> bool:
     """Update dependency version in pom.xml."""
-    content = pom_path.read_text()
-    pattern = re.compile(
-        rf"(<dependency>.*?<groupId>{re.escape(group_id)}</groupId>.*?<artifactId>{re.escape(artifact_id)}</artifactId>.*?<version>).*?(</version>.*?</dependency>)",
-        re.DOTALL,
-    )
+    content = _read(pom_path)
+    group_tag = f"<groupId>{group_id}</groupId>"
+    artifact_tag = f"<artifactId>{artifact_id}</artifactId>"
     replacement = rf"\g<1>{version}\g<2>"
-    updated = pattern.sub(replacement, content)
-    pom_path.write_text(updated)
-
 
-def update_csproj_dependency(csproj_path: Path, package_name: str, version: str) -> None:
+    # Locate each <dependency> block with plain string scans, then only rewrite <version> inside matching blocks
+    parts: list[str] = []
+    pos = 0
+    while (start := content.find("<dependency>", pos)) != -1:
+        end = content.find("</dependency>", start)
+        if end == -1:
+            break
+        block = content[start:end]
+        if group_tag in block and artifact_tag in block:
+            block = _POM_DEPENDENCY_VERSION_RE.sub(replacement, block, count=1)
+        parts.append(content[pos:start])
+        parts.append(block)
+        pos = end
+    parts.append(content[pos:])
+
+    return _write_if_changed(pom_path, content, "".join(parts))
+
+
+def update_csproj_dependency(csproj_path: Path, package_name: str, version: str) -> bool:
     """Update PackageReference version in .csproj."""
-    content = csproj_path.read_text()
-    pattern = re.compile(rf'(<PackageReference\s+Include="{re.escape(package_name)}"\s+Version=")[^"]+(")')
+    content = _read(csproj_path)
     replacement = rf"\g<1>{version}\g<2>"
-    updated = pattern.sub(replacement, content)
-    csproj_path.write_text(updated)
+    updated = _csproj_dependency_pattern(package_name).sub(replacement, content)
+    return _write_if_changed(csproj_path, content, updated)
 
 
-def update_mix_dependency(mix_path: Path, package_name: str, version: str) -> None:
+def update_mix_dependency(mix_path: Path, package_name: str, version: str) -> bool:
     """Update dependency version in mix.exs."""
-    content = mix_path.read_text()
-    pattern = re.compile(rf'(\{{{re.escape(package_name)},\s*"~>\s*)[^"]+("}})')
+    content = _read(mix_path)
     replacement = rf"\g<1>{version}\g<2>"
-    updated = pattern.sub(replacement, content)
-    mix_path.write_text(updated)
+    updated = _mix_dependency_pattern(package_name).sub(replacement, content)
+    return _write_if_changed(mix_path, content, updated)
 
 
 def update_mix_version(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update @version declarations inside mix.exs files."""
-    content = file_path.read_text()
-    match = re.search(r'@version\s*=?\s*"([^"]+)"', content)
-    old_version = match.group(1) if match else "NOT FOUND"
+    content = _read(file_path)
+    match = _MIX_VERSION_RE.search(content)
+    old_version = match.group(2) if match else "NOT FOUND"
 
     if old_version == version:
         return False, old_version, version
 
-    new_content = re.sub(r'(@version\s*=?\s*)"[^"]+"', rf'\1"{version}"', content, count=1)
-    file_path.write_text(new_content)
+    new_content = _MIX_VERSION_RE.sub(rf'\1"{version}"', content, count=1)
+    _write(file_path, new_content)
     return True, old_version, version
 
 
 def update_csproj_version(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update <Version> tags inside .csproj files."""
-    content = file_path.read_text()
-    match = re.search(r"<Version>([^<]+)</Version>", content)
-    old_version = match.group(1) if match else "NOT FOUND"
+    content = _read(file_path)
+    match = _CSPROJ_VERSION_RE.search(content)
+    old_version = match.group(2) if match else "NOT FOUND"
 
     if old_version == version:
         return False, old_version, version
 
-    new_content = re.sub(r"(<Version>)[^<]+(</Version>)", rf"\g<1>{version}\2", content, count=1)
-    file_path.write_text(new_content)
+    new_content = _CSPROJ_VERSION_RE.sub(rf"\g<1>{version}\g<3>", content, count=1)
+    _write(file_path, new_content)
     return True, old_version, version
 
 
 def update_pom_version(file_path: Path, version: str) -> tuple[bool, str, str]:
     """Update the primary <version> tag for the Java package."""
-    content = file_path.read_text()
-    pattern = re.compile(
-        r"(<artifactId>\s*html-to-markdown\s*</artifactId>\s*<version>)([^<]+)(</version>)",
-        re.IGNORECASE | re.DOTALL,
-    )
-    match = pattern.search(content)
+    content = _read(file_path)
+    match = _POM_VERSION_RE.search(content)
     old_version = match.group(2).strip() if match else "NOT FOUND"
 
     if old_version == version:
         return False, old_version, version
 
-    new_content, count = pattern.subn(lambda m: f"{m.group(1)}{version}{m.group(3)}", content, count=1)
+    new_content, count = _POM_VERSION_RE.subn(rf"\g<1>{version}\g<3>", content, count=1)
     if count == 0:
         return False, old_version, version
 
-    file_path.write_text(new_content)
+    _write(file_path, new_content)
     return True, old_version, version
 
 
+def _print_test_app_update(changed: bool, message: str) -> None:
+    print(f"  {'✓' if changed else '—'} {message}")
+
+
 def update_test_apps_versions(repo_root: Path, version: str) -> None:
     """Update test_apps package manifests with new version."""
     test_apps_dir = repo_root / "tests" / "test_apps"
@@ -384,75 +630,113 @@ def update_test_apps_versions(repo_root: Path, version: str) -> None:
     # Update Python pyproject.toml
     python_toml = test_apps_dir / "python" / "pyproject.toml"
     if python_toml.exists():
-        update_toml_dependency(python_toml, "html-to-markdown", f">={version}")
-        print(f"  ✓ Python pyproject.toml → html-to-markdown>={version}")
+        changed = update_toml_dependency(python_toml, "html-to-markdown", f">={version}")
+        _print_test_app_update(changed, f"Python pyproject.toml → html-to-markdown>={version}")
 
     # Update Node package.json
     node_pkg = test_apps_dir / "node" / "package.json"
     if node_pkg.exists():
-        update_json_dependency(node_pkg, "html-to-markdown", f">={version}")
-        print(f"  ✓ Node package.json → html-to-markdown>={version}")
+        changed = update_json_dependency(node_pkg, "html-to-markdown", f">={version}")
+        _print_test_app_update(changed, f"Node package.json → html-to-markdown>={version}")
 
     # Update Ruby Gemfile
     ruby_gemfile = test_apps_dir / "ruby" / "Gemfile"
     if ruby_gemfile.exists():
-        update_gemfile_dependency(ruby_gemfile, "html-to-markdown", f">= {version}")
-        print(f"  ✓ Ruby Gemfile → html-to-markdown>={version}")
+        changed = update_gemfile_dependency(ruby_gemfile, "html-to-markdown", f">= {version}")
+        _print_test_app_update(changed, f"Ruby Gemfile → html-to-markdown>={version}")
 
     # Update PHP composer.json
     php_composer = test_apps_dir / "php" / "composer.json"
     if php_composer.exists():
-        update_json_dependency(php_composer, "kreuzberg-dev/html-to-markdown", f">={version}")
-        print(f"  ✓ PHP composer.json → kreuzberg-dev/html-to-markdown>={version}")
+        changed = update_json_dependency(php_composer, "kreuzberg-dev/html-to-markdown", f">={version}")
+        _print_test_app_update(changed, f"PHP composer.json → kreuzberg-dev/html-to-markdown>={version}")
 
     # Update Go go.mod
     go_mod = test_apps_dir / "go" / "go.mod"
     if go_mod.exists():
-        update_go_mod(go_mod, "github.com/kreuzberg-dev/html-to-markdown/packages/go/v2", version)
-        print(f"  ✓ Go go.mod → v{version}")
+        changed = update_go_mod(go_mod, "github.com/kreuzberg-dev/html-to-markdown/packages/go/v2", version)
+        _print_test_app_update(changed, f"Go go.mod → v{version}")
 
     # Update Java pom.xml
     java_pom = test_apps_dir / "java" / "pom.xml"
     if java_pom.exists():
-        update_pom_dependency(java_pom, "dev.kreuzberg", "html-to-markdown", version)
-        print(f"  ✓ Java pom.xml → {version}")
+        changed = update_pom_dependency(java_pom, "dev.kreuzberg", "html-to-markdown", version)
+        _print_test_app_update(changed, f"Java pom.xml → {version}")
 
     # Update C# TestApp.csproj
     csharp_csproj = test_apps_dir / "csharp" / "TestApp.csproj"
     if csharp_csproj.exists():
-        update_csproj_dependency(csharp_csproj, "HtmlToMarkdown", version)
-        print(f"  ✓ C# TestApp.csproj → {version}")
+        changed = update_csproj_dependency(csharp_csproj, "HtmlToMarkdown", version)
+        _print_test_app_update(changed, f"C# TestApp.csproj → {version}")
 
     # Update Elixir mix.exs
     elixir_mix = test_apps_dir / "elixir" / "mix.exs"
     if elixir_mix.exists():
-        update_mix_dependency(elixir_mix, "html_to_markdown", version)
-        print(f"  ✓ Elixir mix.exs → ~> {version}")
+        changed = update_mix_dependency(elixir_mix, "html_to_markdown", version)
+        _print_test_app_update(changed, f"Elixir mix.exs → ~> {version}")
 
 
-@dataclass
+_WALK_SKIP_DIRS = frozenset({"node_modules", ".git", "target"})
+
+
+# Manifests discovered by walking the repository rather than found at fixed paths
+_WALKED_MANIFESTS = frozenset({"package.json", "Cargo.toml"})
+
+
+def _walk_pruned(root: Path, filenames: frozenset[str], skip: frozenset[str] = _WALK_SKIP_DIRS) -> Iterator[Path]:
+    """Yield files whose name is in filenames below root, never descending into skipped directories."""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs: list[str] = []
+    for entry in entries:
+        if entry.name in filenames and entry.is_file():
+            yield Path(entry.path)
+        elif entry.name not in skip and entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+
+    for subdir in subdirs:
+        yield from _walk_pruned(Path(subdir), filenames, skip)
+
+
+@functools.cache
+def find_manifests(repo_root: Path) -> dict[str, list[Path]]:
+    """Walk the repository once and group the walked manifests by file name, in walk order."""
+    manifests: dict[str, list[Path]] = {name: [] for name in _WALKED_MANIFESTS}
+    for path in _walk_pruned(repo_root, _WALKED_MANIFESTS):
+        manifests[path.name].append(path)
+    return manifests
+
+
+@dataclass(slots=True, frozen=True)
 class SyncReport:
-    updated: list[str]
-    unchanged: list[str]
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    # Progress lines are buffered so concurrently run steps still print in a fixed order
+    lines: list[str] = field(default_factory=list)
 
     def record(self, rel_path: Path, changed: bool, detail: str | None = None) -> None:
         if changed:
             if detail:
-                print(f"✓ {rel_path}: {detail}")
+                self.lines.append(f"✓ {rel_path}: {detail}")
             else:
-                print(f"✓ {rel_path}")
+                self.lines.append(f"✓ {rel_path}")
             self.updated.append(str(rel_path))
         else:
             self.unchanged.append(str(rel_path))
 
+    def merge(self, other: "SyncReport") -> None:
+        self.updated.extend(other.updated)
+        self.unchanged.extend(other.unchanged)
+        self.lines.extend(other.lines)
+
 
 def sync_package_jsons(repo_root: Path, version: str, report: SyncReport) -> None:
     """Sync package.json files, including build artifacts but skipping deps."""
-    for pkg_json in repo_root.rglob("package.json"):
-        # Skip node_modules, .git, and target directories
-        if any(part in pkg_json.parts for part in ["node_modules", ".git", "target"]):
-            continue
-
+    for pkg_json in find_manifests(repo_root)["package.json"]:
         changed, old_ver, new_ver = update_package_json(pkg_json, version)
         report.record(pkg_json.relative_to(repo_root), changed, f"{old_ver} → {new_ver}")
 
@@ -524,25 +808,29 @@ def sync_uv_lock(repo_root: Path, version: str, report: SyncReport) -> None:
 
 
 def sync_cargo_versions(repo_root: Path, version: str, report: SyncReport) -> None:
-    for cargo_toml in repo_root.rglob("Cargo.toml"):
-        if "target" in cargo_toml.parts:
-            continue
-        if cargo_toml == repo_root / "Cargo.toml":
-            continue
+    root_cargo_toml = repo_root / "Cargo.toml"
+    dependency_updates: list[Path] = []
 
-        content = cargo_toml.read_text()
-        has_hardcoded = re.search(r'^version\s*=\s*"[^"]+"', content, re.MULTILINE)
-        if has_hardcoded and "version.workspace = true" not in content:
-            changed, old_ver, new_ver = update_cargo_toml(cargo_toml, version)
-            report.record(cargo_toml.relative_to(repo_root), changed, f"{old_ver} → {new_ver}")
+    for cargo_toml in find_manifests(repo_root)["Cargo.toml"]:
+        # Apply both transforms to one in-memory copy so each manifest is read and written at most once
+        original = content = _read(cargo_toml)
 
-    for cargo_toml in repo_root.rglob("Cargo.toml"):
-        if "target" in cargo_toml.parts:
-            continue
-        if update_rust_dependency_versions(cargo_toml, version):
-            report.record(
-                cargo_toml.relative_to(repo_root), True, f"updated html-to-markdown-rs dependency → {version}"
-            )
+        if cargo_toml != root_cargo_toml:
+            has_hardcoded = "version" in content and _HARDCODED_CARGO_VERSION_RE.search(content)
+            if has_hardcoded and "version.workspace = true" not in content:
+                content, old_ver = replace_cargo_version(content, version)
+                report.record(cargo_toml.relative_to(repo_root), content != original, f"{old_ver} → {version}")
+
+        content, pin_count = replace_rust_dependency_versions(content, version)
+        if pin_count:
+            dependency_updates.append(cargo_toml)
+
+        if content != original:
+            _write(cargo_toml, content)
+
+    # Dependency pin updates are reported after all hardcoded version bumps
+    for cargo_toml in dependency_updates:
+        report.record(cargo_toml.relative_to(repo_root), True, f"updated html-to-markdown-rs dependency → {version}")
 
 
 def sync_composer(repo_root: Path, version: str, report: SyncReport) -> None:
@@ -559,6 +847,42 @@ def sync_composer(repo_root: Path, version: str, report: SyncReport) -> None:
         report.record(composer.relative_to(repo_root), changed, f"{old_ver} → {new_ver}")
 
 
+SyncStep = Callable[[Path, str, SyncReport], None]
+
+# Each step touches its own set of files, so the steps can run concurrently
+SYNC_STEPS: tuple[SyncStep, ...] = (
+    sync_package_jsons,
+    sync_pyprojects,
+    sync_ruby,
+    sync_python_version_file,
+    sync_mix,
+    sync_node_binding,
+    sync_csproj,
+    sync_poms,
+    sync_uv_lock,
+    sync_composer,
+    sync_cargo_versions,
+)
+
+
+def run_sync_steps(repo_root: Path, version: str) -> SyncReport:
+    """Run every sync step on a thread pool and merge their reports in step order."""
+
+    def run(step: SyncStep) -> SyncReport:
+        step_report = SyncReport()
+        step(repo_root, version, step_report)
+        return step_report
+
+    # Walk the tree up front so the steps share one walk instead of racing to fill the cache
+    find_manifests(repo_root)
+
+    report = SyncReport()
+    with ThreadPoolExecutor(max_workers=min(len(SYNC_STEPS), (os.cpu_count() or 1) * 2)) as pool:
+        for step_report in pool.map(run, SYNC_STEPS):
+            report.merge(step_report)
+    return report
+
+
 def summarize(version: str, report: SyncReport) -> None:
     print("\n📊 Summary:")
     print(f"   Updated: {len(report.updated)} files")
@@ -571,6 +895,10 @@ def summarize(version: str, report: SyncReport) -> None:
 
 
 def main() -> None:
+    # Block-buffer stdout so progress goes out in a few large writes even when attached to a terminal
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
     repo_root = get_repo_root()
 
     try:
@@ -581,18 +909,9 @@ def main() -> None:
 
     print(f"\n📦 Syncing version {version} from Cargo.toml\n")
 
-    report = SyncReport(updated=[], unchanged=[])
-    sync_package_jsons(repo_root, version, report)
-    sync_pyprojects(repo_root, version, report)
-    sync_ruby(repo_root, version, report)
-    sync_python_version_file(repo_root, version, report)
-    sync_mix(repo_root, version, report)
-    sync_node_binding(repo_root, version, report)
-    sync_csproj(repo_root, version, report)
-    sync_poms(repo_root, version, report)
-    sync_uv_lock(repo_root, version, report)
-    sync_composer(repo_root, version, report)
-    sync_cargo_versions(repo_root, version, report)
+    report = run_sync_steps(repo_root, version)
+    if report.lines:
+        print("\n".join(report.lines))
 
     # Update test_apps manifests
     update_test_apps_versions(repo_root, version)